@@ -1,11 +1,21 @@
 #!/usr/bin/env python3
 from pathlib import Path
+import argparse
 import json
+import os
 import re
 
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib encoder
+    orjson = None
+
 ROOT = Path('.')
 VERSIONS_DIR = ROOT / '역본'
 
+BHS_RE = re.compile(r'^(\d+)\s+(.+)$')
+NKRV_RE = re.compile(r'^(\d+)-(.+)$')
+
 TRANSLATIONS = {
     'BHS': {
         'label': 'BHS',
@@ -27,47 +37,52 @@ TRANSLATIONS = {
     },
 }
 
+parser = argparse.ArgumentParser(description='Build data/index.json from the 역본 folders.')
+parser.add_argument('--pretty', action='store_true', help='write indented JSON for debugging')
+args = parser.parse_args()
+
 
 def list_dirs(path: Path):
-    return [p for p in path.iterdir() if p.is_dir()]
+    with os.scandir(path) as it:
+        return [entry for entry in it if entry.is_dir()]
 
 
 def list_md_files(path: Path):
-    files = [p for p in path.iterdir() if p.is_file() and p.suffix.lower() == '.md']
-    def sort_key(p: Path):
-        try:
-            return int(p.stem)
-        except ValueError:
-            return 10**9
-    files.sort(key=sort_key)
-    return [p.name for p in files]
-
-
-# Parse BHS directories for English names and order
-bhs_dirs = list_dirs(VERSIONS_DIR / 'BHS')
+    with os.scandir(path) as it:
+        names = [e.name for e in it
+                 if len(e.name) > 3 and e.name[-3:].lower() == '.md' and e.is_file()]
+    names.sort(key=lambda n: int(n[:-3]) if n[:-3].isdecimal() else 10**9)
+    return names
+
+
+# Scan each translation folder once. BHS and NKRV directory names also
+# carry the canonical order and the English/Korean book names.
 order_to_en = {}
-for d in bhs_dirs:
-    if d.name == '_cache':
-        continue
-    m = re.match(r'^(\d+)\s+(.+)$', d.name)
-    if not m:
-        continue
-    order = int(m.group(1))
-    name_en = m.group(2).strip()
-    order_to_en[order] = name_en
-
-# Parse NKRV directories for Korean names and order
-nkrv_dirs = list_dirs(VERSIONS_DIR / 'NKRV')
 order_to_ko = {}
 ko_to_order = {}
-for d in nkrv_dirs:
-    m = re.match(r'^(\d+)-(.+)$', d.name)
-    if not m:
-        continue
-    order = int(m.group(1))
-    name_ko = m.group(2).strip()
-    order_to_ko[order] = name_ko
-    ko_to_order[name_ko] = order
+scanned_dirs = {}
+for key in TRANSLATIONS:
+    entries = []
+    for d in list_dirs(VERSIONS_DIR / key):
+        order = None
+        if key == 'BHS':
+            if d.name == '_cache':
+                continue
+            m = BHS_RE.match(d.name)
+            if not m:
+                continue
+            order = int(m.group(1))
+            order_to_en[order] = m.group(2).strip()
+        elif key == 'NKRV':
+            m = NKRV_RE.match(d.name)
+            if not m:
+                continue
+            order = int(m.group(1))
+            name_ko = m.group(2).strip()
+            order_to_ko[order] = name_ko
+            ko_to_order[name_ko] = order
+        entries.append((d, order))
+    scanned_dirs[key] = entries
 
 # Build canonical book list
 books = []
@@ -84,30 +99,13 @@ for order in sorted(order_to_en.keys()):
 # Build translation mappings
 translations = {}
 for key, meta in TRANSLATIONS.items():
-    base = VERSIONS_DIR / key
-    book_dirs = list_dirs(base)
     book_dir_map = {}
     chapters_map = {}
 
-    for d in book_dirs:
-        if key == 'BHS':
-            if d.name == '_cache':
-                continue
-            m = re.match(r'^(\d+)\s+(.+)$', d.name)
-            if not m:
-                continue
-            order = int(m.group(1))
-            book_id = order_to_en.get(order)
-        elif key == 'NKRV':
-            m = re.match(r'^(\d+)-(.+)$', d.name)
-            if not m:
-                continue
-            order = int(m.group(1))
-            book_id = order_to_en.get(order)
-        else:  # KNT
-            name_ko = d.name
-            order = ko_to_order.get(name_ko)
-            book_id = order_to_en.get(order) if order else None
+    for d, order in scanned_dirs[key]:
+        if order is None:  # KNT: matched by Korean name against NKRV
+            order = ko_to_order.get(d.name)
+        book_id = order_to_en.get(order)
         if not book_id:
             continue
         book_dir_map[book_id] = d.name
@@ -120,10 +118,10 @@ for key, meta in TRANSLATIONS.items():
     }
 
 # Compute availability per book
-availability = {}
-for book in books:
-    book_id = book['id']
-    availability[book_id] = [t for t in translations.keys() if book_id in translations[t]['bookDirs']]
+availability = {book['id']: [] for book in books}
+for key, translation in translations.items():
+    for book_id in translation['bookDirs']:
+        availability[book_id].append(key)
 
 index = {
     'books': books,
@@ -133,7 +131,14 @@ index = {
 
 out_dir = ROOT / 'data'
 out_dir.mkdir(exist_ok=True)
-with open(out_dir / 'index.json', 'w', encoding='utf-8') as f:
-    json.dump(index, f, ensure_ascii=False, indent=2)
+if orjson is not None:
+    option = orjson.OPT_INDENT_2 if args.pretty else 0
+    (out_dir / 'index.json').write_bytes(orjson.dumps(index, option=option))
+else:
+    with open(out_dir / 'index.json', 'w', encoding='utf-8') as f:
+        if args.pretty:
+            json.dump(index, f, ensure_ascii=False, indent=2)
+        else:
+            json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
 
 print('Wrote data/index.json')